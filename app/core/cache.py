@@ -0,0 +1,353 @@
+"""Caching layer with Redis backend and in-memory fallback.
+
+Usage:
+
+    from app.core.cache import cache, cached
+
+    cache.set("restaurant:123", data, ttl=300)
+    data = cache.get("restaurant:123")
+
+    @cached(ttl=300)
+    async def expensive_lookup(restaurant_id: str):
+        ...
+"""
+
+import functools
+import hashlib
+import heapq
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    import redis
+    import redis.asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    print("Redis module not available, using in-memory cache only")
+    REDIS_AVAILABLE = False
+
+
+# Type-dispatched encoders: singledispatch resolves on type(value) via a
+# C-level registry lookup, replacing a per-call isinstance tuple walk.
+@functools.singledispatch
+def _enc(value: Any) -> str:
+    return json.dumps(value, default=lambda o: getattr(o, "__dict__", str(o)))
+
+
+@_enc.register(str)
+@_enc.register(int)
+@_enc.register(float)
+@_enc.register(bool)
+@_enc.register(type(None))
+def _enc_scalar(value: Any) -> str:
+    return json.dumps(value)
+
+
+class Cache:
+    """Namespaced cache backed by Redis, falling back to an in-process dict."""
+
+    def __init__(self, namespace: str = "bitebase", default_ttl: int = 300):
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self.redis_client = None
+        self.async_redis_client = None
+        self._memory_cache: Dict[str, Dict[str, Any]] = {}
+        # Min-heap of (expires_at, cache_key) so expired in-memory entries
+        # can be reclaimed proactively instead of only on access.
+        self._expiry_heap: List[tuple] = []
+        # Tiny LRU of id(value) -> (value, serialized) so hot re-writes of the
+        # same immutable payload skip the encode. Holding the value itself
+        # keeps the id alive, so an id hit is guaranteed to be the same object.
+        self._enc_cache: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def initialize(self, redis_url: Optional[str] = None) -> None:
+        """Connect to Redis if available, otherwise stay on the memory fallback."""
+        if not REDIS_AVAILABLE or not redis_url:
+            return
+        try:
+            pool = redis.ConnectionPool.from_url(
+                redis_url, max_connections=100, socket_keepalive=True
+            )
+            self.redis_client = redis.Redis(connection_pool=pool)
+            self.redis_client.ping()
+            async_pool = redis.asyncio.ConnectionPool.from_url(
+                redis_url, max_connections=100, socket_keepalive=True
+            )
+            self.async_redis_client = redis.asyncio.Redis(connection_pool=async_pool)
+        except Exception as e:
+            print(f"Redis connection failed, using in-memory cache: {e}")
+            self.redis_client = None
+            self.async_redis_client = None
+
+    def _generate_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    _ENC_CACHE_SIZE = 256
+    _ENC_CACHEABLE = (str, bytes, int, float, tuple, frozenset)
+
+    def _serialize(self, value: Any) -> str:
+        if isinstance(value, self._ENC_CACHEABLE):
+            hit = self._enc_cache.get(id(value))
+            if hit is not None and hit[0] is value:
+                self._enc_cache.move_to_end(id(value))
+                return hit[1]
+            data = self._encode(value)
+            self._enc_cache[id(value)] = (value, data)
+            if len(self._enc_cache) > self._ENC_CACHE_SIZE:
+                self._enc_cache.popitem(last=False)
+            return data
+        return self._encode(value)
+
+    def _encode(self, value: Any) -> str:
+        return _enc(value)
+
+    def _deserialize(self, data: Any) -> Any:
+        if data is None:
+            return None
+        if isinstance(data, bytes):
+            data = data.decode()
+        return json.loads(data)
+
+    def _sweep_expired(self, budget: int = 32) -> None:
+        """Pop up to `budget` expired entries off the heap and free them.
+
+        Heap entries may be stale (key overwritten or deleted since the push),
+        so only drop dict entries whose recorded expiry still matches.
+        """
+        now = time.time()
+        while self._expiry_heap and budget > 0:
+            expires_at, cache_key = self._expiry_heap[0]
+            if expires_at >= now:
+                break
+            heapq.heappop(self._expiry_heap)
+            entry = self._memory_cache.get(cache_key)
+            if entry is not None and entry["expires_at"] == expires_at:
+                del self._memory_cache[cache_key]
+            budget -= 1
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for `key`, or None if missing or expired."""
+        self._sweep_expired()
+        cache_key = self._generate_key(key)
+
+        if self.redis_client:
+            try:
+                return self._deserialize(self.redis_client.get(cache_key))
+            except Exception as e:
+                print(f"Redis get failed: {e}")
+                return None
+
+        entry = self._memory_cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry["expires_at"] is not None and entry["expires_at"] < time.time():
+            del self._memory_cache[cache_key]
+            return None
+        return self._deserialize(entry["value"])
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Store `value` under `key` with a TTL in seconds (default_ttl if None)."""
+        self._sweep_expired()
+        cache_key = self._generate_key(key)
+        if ttl is None:
+            ttl = self.default_ttl
+
+        if self.redis_client:
+            try:
+                data = self._serialize(value)
+                if ttl:
+                    self.redis_client.setex(cache_key, ttl, data)
+                else:
+                    self.redis_client.set(cache_key, data)
+                return True
+            except Exception as e:
+                print(f"Redis set failed: {e}")
+                return False
+
+        # Store the serialized form (same bytes Redis would hold) so callers
+        # can't mutate cached data through a shared reference, and both
+        # branches of get() decode one format.
+        expires_at = time.time() + ttl if ttl else None
+        self._memory_cache[cache_key] = {
+            "value": self._serialize(value),
+            "expires_at": expires_at,
+        }
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, cache_key))
+        return True
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Fetch several keys in one round trip; missing/expired keys are omitted."""
+        self._sweep_expired()
+        cache_keys = [self._generate_key(k) for k in keys]
+
+        if self.redis_client:
+            try:
+                vals = self.redis_client.mget(cache_keys)
+                return {
+                    k: self._deserialize(v)
+                    for k, v in zip(keys, vals)
+                    if v is not None
+                }
+            except Exception as e:
+                print(f"Redis mget failed: {e}")
+                return {}
+
+        now = time.time()
+        results: Dict[str, Any] = {}
+        for k, cache_key in zip(keys, cache_keys):
+            entry = self._memory_cache.get(cache_key)
+            if entry is None:
+                continue
+            if entry["expires_at"] is not None and entry["expires_at"] < now:
+                del self._memory_cache[cache_key]
+                continue
+            results[k] = self._deserialize(entry["value"])
+        return results
+
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several key/value pairs, pipelined into one round trip on Redis."""
+        if ttl is None:
+            ttl = self.default_ttl
+
+        if self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline()
+                for k, value in items.items():
+                    cache_key = self._generate_key(k)
+                    data = self._serialize(value)
+                    if ttl:
+                        pipe.setex(cache_key, ttl, data)
+                    else:
+                        pipe.set(cache_key, data)
+                pipe.execute()
+                return True
+            except Exception as e:
+                print(f"Redis pipelined set failed: {e}")
+                return False
+
+        for k, value in items.items():
+            self.set(k, value, ttl)
+        return True
+
+    async def aget(self, key: str) -> Any:
+        """Async variant of get; awaits Redis so the event loop is not blocked."""
+        if self.async_redis_client:
+            try:
+                cache_key = self._generate_key(key)
+                return self._deserialize(await self.async_redis_client.get(cache_key))
+            except Exception as e:
+                print(f"Redis get failed: {e}")
+                return None
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Async variant of set; awaits Redis so the event loop is not blocked."""
+        if self.async_redis_client:
+            try:
+                cache_key = self._generate_key(key)
+                if ttl is None:
+                    ttl = self.default_ttl
+                data = self._serialize(value)
+                if ttl:
+                    await self.async_redis_client.setex(cache_key, ttl, data)
+                else:
+                    await self.async_redis_client.set(cache_key, data)
+                return True
+            except Exception as e:
+                print(f"Redis set failed: {e}")
+                return False
+        return self.set(key, value, ttl)
+
+    def delete(self, key: str) -> bool:
+        """Remove `key` from the cache if present."""
+        self._sweep_expired()
+        cache_key = self._generate_key(key)
+
+        if self.redis_client:
+            try:
+                return bool(self.redis_client.delete(cache_key))
+            except Exception as e:
+                print(f"Redis delete failed: {e}")
+                return False
+
+        return self._memory_cache.pop(cache_key, None) is not None
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """Drop every key under `namespace` (defaults to this cache's namespace)."""
+        prefix = f"{namespace or self.namespace}:"
+
+        if self.redis_client:
+            try:
+                cleared = 0
+                batch: List[bytes] = []
+                for key in self.redis_client.scan_iter(match=f"{prefix}*", count=1000):
+                    batch.append(key)
+                    if len(batch) >= 500:
+                        pipe = self.redis_client.pipeline()
+                        pipe.unlink(*batch)
+                        pipe.execute()
+                        cleared += len(batch)
+                        batch = []
+                if batch:
+                    pipe = self.redis_client.pipeline()
+                    pipe.unlink(*batch)
+                    pipe.execute()
+                    cleared += len(batch)
+                return cleared
+            except Exception as e:
+                print(f"Redis clear failed: {e}")
+                return 0
+
+        stale = [k for k in self._memory_cache if k.startswith(prefix)]
+        for k in stale:
+            del self._memory_cache[k]
+        return len(stale)
+
+
+# Shared cache instance used across the API routers
+cache = Cache()
+
+
+def _arg_digest(value: Any, h) -> None:
+    """Feed one argument into the running key digest without temporaries."""
+    d = getattr(value, "__dict__", None)
+    if d:
+        for k in sorted(d):
+            h.update(k.encode())
+            h.update(repr(d[k]).encode())
+    else:
+        h.update(repr(value).encode())
+
+
+def cached(ttl: Optional[int] = None, namespace: Optional[str] = None):
+    """Decorator caching an async function's result keyed by its arguments."""
+
+    def decorator(func):
+        _prefix = f"{func.__module__}.{func.__qualname__}".encode()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            h = hashlib.blake2b(_prefix, digest_size=16)
+            for arg in args:
+                _arg_digest(arg, h)
+            for k in sorted(kwargs):
+                h.update(k.encode())
+                _arg_digest(kwargs[k], h)
+            key = f"{func.__qualname__}:{h.hexdigest()}"
+            if namespace:
+                key = f"{namespace}:{key}"
+
+            result = await cache.aget(key)
+            if result is not None:
+                return result
+            result = await func(*args, **kwargs)
+            if result is not None:
+                await cache.aset(key, result, ttl)
+            return result
+
+        return wrapper
+
+    return decorator
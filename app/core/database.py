@@ -0,0 +1,207 @@
+"""Database access layer backed by SQLAlchemy.
+
+Usage:
+
+    from app.core.database import db_client
+
+    db_client.initialize()
+    with db_client.get_session() as session:
+        ...
+    rows = db_client.execute_query("SELECT * FROM foot_traffic_data WHERE id = :id", {"id": 1})
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+try:
+    from functools import lru_cache
+
+    from sqlalchemy import (
+        Column,
+        Date,
+        Float,
+        ForeignKey,
+        Index,
+        Integer,
+        String,
+        bindparam,
+        create_engine,
+        text,
+    )
+    from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    print("SQLAlchemy module not available, database features disabled")
+    SQLALCHEMY_AVAILABLE = False
+
+_db_logger = logging.getLogger("bitebase.db")
+
+if SQLALCHEMY_AVAILABLE:
+    @lru_cache(maxsize=256)
+    def _compile(query: str):
+        """Reuse TextClause objects so repeated queries skip SQL text parsing."""
+        return text(query)
+
+    Base = declarative_base()
+
+    class FootTrafficData(Base):
+        """Daily foot-traffic record for one restaurant."""
+
+        __tablename__ = "foot_traffic_data"
+
+        id = Column(Integer, primary_key=True, index=True)
+        # No standalone restaurant_id index: the composite index below
+        # covers restaurant_id-only lookups via its leading column.
+        restaurant_id = Column(String, nullable=False)
+        date = Column(Date, nullable=False)
+        total_visitors = Column(Integer, nullable=False, default=0)
+
+        hourly_data = relationship(
+            "HourlyTrafficData", back_populates="foot_traffic"
+        )
+        daily_data = relationship(
+            "DailyTrafficData", back_populates="foot_traffic"
+        )
+
+        # Time-range traffic lookups filter on (restaurant_id, date); the
+        # composite index turns them into an index seek instead of a scan.
+        __table_args__ = (
+            Index("ix_foot_traffic_rid_date", "restaurant_id", "date"),
+        )
+
+    class HourlyTrafficData(Base):
+        """Per-hour visitor breakdown belonging to a FootTrafficData row."""
+
+        __tablename__ = "hourly_traffic_data"
+
+        id = Column(Integer, primary_key=True, index=True)
+        foot_traffic_id = Column(
+            Integer, ForeignKey("foot_traffic_data.id"), nullable=False
+        )
+        hour = Column(String, nullable=False)
+        visitors = Column(Integer, nullable=False, default=0)
+        percentage = Column(Float, nullable=False, default=0.0)
+
+        foot_traffic = relationship("FootTrafficData", back_populates="hourly_data")
+
+        # One index on the FK join column; index=True on the Column would
+        # create an identical second one.
+        __table_args__ = (Index("ix_hourly_ftid", "foot_traffic_id"),)
+
+    class DailyTrafficData(Base):
+        """Per-day visitor breakdown belonging to a FootTrafficData row."""
+
+        __tablename__ = "daily_traffic_data"
+
+        id = Column(Integer, primary_key=True, index=True)
+        foot_traffic_id = Column(
+            Integer, ForeignKey("foot_traffic_data.id"), nullable=False
+        )
+        day = Column(String, nullable=False)
+        visitors = Column(Integer, nullable=False, default=0)
+        percentage = Column(Float, nullable=False, default=0.0)
+
+        foot_traffic = relationship("FootTrafficData", back_populates="daily_data")
+
+        __table_args__ = (Index("ix_daily_ftid", "foot_traffic_id"),)
+
+
+class DatabaseClient:
+    """Engine/session holder shared by the API routers."""
+
+    def __init__(self):
+        self.engine = None
+        self._session_factory = None
+
+    def initialize(self, database_url: Optional[str] = None) -> None:
+        """Create the engine and session factory from DATABASE_URL."""
+        if not SQLALCHEMY_AVAILABLE:
+            return
+        database_url = database_url or os.getenv("DATABASE_URL")
+        if not database_url:
+            print("DATABASE_URL not set, database client not initialized")
+            return
+        try:
+            self.engine = create_engine(
+                database_url,
+                pool_recycle=1800,
+                pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+                max_overflow=int(os.getenv("DB_POOL_OVERFLOW", "40")),
+                # LIFO keeps the most recently used (warmest) connections in
+                # rotation; pre-ping is redundant alongside pool_recycle.
+                pool_use_lifo=True,
+                pool_pre_ping=False,
+                future=True,
+            )
+            self._session_factory = sessionmaker(bind=self.engine)
+        except Exception as e:
+            print(f"Database connection failed: {e}")
+            self.engine = None
+            self._session_factory = None
+
+    @contextmanager
+    def get_session(self):
+        """Yield a session that commits on success and rolls back on error.
+
+        Session timing is DEBUG-only: no clock reads or log formatting happen
+        per request unless the db logger is actually enabled for DEBUG.
+        """
+        if self._session_factory is None:
+            raise RuntimeError("Database client is not initialized")
+        start_ns = (
+            time.perf_counter_ns()
+            if _db_logger.isEnabledFor(logging.DEBUG)
+            else 0
+        )
+        session = self._session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+            if start_ns:
+                _db_logger.debug(
+                    "session closed after %.2f ms",
+                    (time.perf_counter_ns() - start_ns) / 1e6,
+                )
+
+    def execute_query(
+        self, query: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Run a parameterized SQL query and return rows as dicts."""
+        with self.get_session() as session:
+            result = session.execute(_compile(query), params or {})
+            return [dict(row._mapping) for row in result]
+
+    _HOURLY_COLUMNS = ("restaurant_id", "date", "hour", "visitors", "percentage")
+
+    def load_hourly_columnar(self, restaurant_ids, since) -> Dict[str, list]:
+        """Bulk-load hourly traffic as columns instead of ORM objects.
+
+        One JOIN query for all restaurants; rows are transposed with zip(*)
+        so no per-row Python objects or relationship lazy-loads are created.
+        Returns {column_name: values} suitable for NumPy/pandas construction.
+        """
+        stmt = _compile(
+            "SELECT f.restaurant_id, f.date, h.hour, h.visitors, h.percentage "
+            "FROM foot_traffic_data f "
+            "JOIN hourly_traffic_data h ON h.foot_traffic_id = f.id "
+            "WHERE f.restaurant_id IN :ids AND f.date >= :since"
+        ).bindparams(bindparam("ids", expanding=True))
+        with self.get_session() as session:
+            rows = session.execute(
+                stmt, {"ids": list(restaurant_ids), "since": since}
+            ).fetchall()
+        if not rows:
+            return {name: [] for name in self._HOURLY_COLUMNS}
+        return dict(zip(self._HOURLY_COLUMNS, (list(col) for col in zip(*rows))))
+
+
+# Shared database client used across the API routers
+db_client = DatabaseClient()
@@ -0,0 +1,126 @@
+"""Application error types and FastAPI exception handlers.
+
+Usage:
+
+    from app.core.errors import AppError, register_error_handlers
+
+    register_error_handlers(app)
+
+    raise AppError("Restaurant not found", code="not_found", status_code=404)
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+class AppError(Exception):
+    """Domain error carrying an HTTP status and a stable error code."""
+
+    def __init__(
+        self,
+        message: str,
+        code: str = "app_error",
+        status_code: int = 400,
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(message)
+        self.message = message
+        self.code = code
+        self.status_code = status_code
+        self.details = details
+
+
+if MSGSPEC_AVAILABLE:
+
+    class ErrorBody(msgspec.Struct):
+        code: str
+        details: Optional[Any] = None
+
+    class ErrorResponse(msgspec.Struct):
+        message: str
+        error: ErrorBody
+        success: bool = False
+
+    def _encode_error(message: str, code: str, details: Any = None) -> bytes:
+        return msgspec.json.encode(
+            ErrorResponse(message=message, error=ErrorBody(code=code, details=details))
+        )
+
+else:
+
+    def _encode_error(message: str, code: str, details: Any = None) -> bytes:
+        return json.dumps(
+            {
+                "message": message,
+                "error": {"code": code, "details": details},
+                "success": False,
+            }
+        ).encode()
+
+
+def _error_response(
+    message: str,
+    code: str,
+    status_code: int,
+    details: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    return Response(
+        content=_encode_error(message, code, details),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def app_error_handler(request: Request, exc: AppError) -> Response:
+    return _error_response(exc.message, exc.code, exc.status_code, exc.details)
+
+
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
+    # HTTPException can carry headers (e.g. WWW-Authenticate on 401s); the
+    # default FastAPI handler forwards them, so this one must too.
+    return _error_response(
+        str(exc.detail),
+        "http_error",
+        exc.status_code,
+        headers=getattr(exc, "headers", None),
+    )
+
+
+async def validation_error_handler(
+    request: Request, exc: RequestValidationError
+) -> Response:
+    # pydantic always supplies loc/msg/type, so direct indexing is safe.
+    errors = [
+        {"loc": e["loc"], "msg": e["msg"], "type": e["type"]} for e in exc.errors()
+    ]
+    return _error_response("Request validation failed", "validation_error", 422, errors)
+
+
+async def pydantic_validation_error_handler(
+    request: Request, exc: ValidationError
+) -> Response:
+    errors = [
+        {"loc": e["loc"], "msg": e["msg"], "type": e["type"]} for e in exc.errors()
+    ]
+    return _error_response("Data validation failed", "validation_error", 422, errors)
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    """Attach the shared exception handlers to the app."""
+    app.add_exception_handler(AppError, app_error_handler)
+    app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(RequestValidationError, validation_error_handler)
+    app.add_exception_handler(ValidationError, pydantic_validation_error_handler)
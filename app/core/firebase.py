@@ -1,34 +1,311 @@
+import concurrent.futures
+import hashlib
 import os
-import firebase_admin
-from firebase_admin import credentials, auth
+import threading
+import time
 from functools import lru_cache
 
-@lru_cache()
-def initialize_firebase_admin():
-    """Initialize Firebase Admin SDK with service account credentials"""
-    cred = credentials.Certificate({
-        "type": "service_account",
-        "project_id": os.getenv("FIREBASE_PROJECT_ID"),
-        "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID"),
-        "private_key": os.getenv("FIREBASE_PRIVATE_KEY"),
-        "client_email": os.getenv("FIREBASE_CLIENT_EMAIL"),
-        "client_id": os.getenv("FIREBASE_CLIENT_ID"),
-        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-        "token_uri": "https://oauth2.googleapis.com/token",
-        "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
-        "client_x509_cert_url": os.getenv("FIREBASE_CLIENT_CERT_URL"),
-        "universe_domain": "googleapis.com"
-    })
-    
+# firebase_admin (and the google-cloud stack underneath it) is imported
+# lazily on first use rather than at module import — it is a large
+# dependency tree that noticeably slows cold starts.
+
+# Service account info is read from the environment once at import time,
+# so per-request callers don't repeat ten os.getenv lookups + a dict build.
+_SERVICE_ACCOUNT_INFO = {
+    "type": "service_account",
+    "project_id": os.getenv("FIREBASE_PROJECT_ID"),
+    "private_key_id": os.getenv("FIREBASE_PRIVATE_KEY_ID"),
+    "private_key": os.getenv("FIREBASE_PRIVATE_KEY"),
+    "client_email": os.getenv("FIREBASE_CLIENT_EMAIL"),
+    "client_id": os.getenv("FIREBASE_CLIENT_ID"),
+    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
+    "client_x509_cert_url": os.getenv("FIREBASE_CLIENT_CERT_URL"),
+    "universe_domain": "googleapis.com",
+}
+
+
+_APP = None
+
+
+def _build_app():
+    import firebase_admin
+    from firebase_admin import credentials
+
     try:
-        return firebase_admin.initialize_app(cred)
-    except ValueError:
         return firebase_admin.get_app()
+    except ValueError:
+        pass
+    cred = credentials.Certificate(_SERVICE_ACCOUNT_INFO)
+    return firebase_admin.initialize_app(cred)
+
+
+@lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    try:
+        from google.api_core import exceptions as gcp_exceptions
+
+        return (gcp_exceptions.Aborted, gcp_exceptions.DeadlineExceeded)
+    except ImportError:
+        return ()
+
+
+def initialize_firebase_admin():
+    """Return the process-wide Firebase Admin app, initializing it if needed"""
+    global _APP
+    if _APP is None:
+        _APP = _build_app()
+    return _APP
+
+# Verified tokens keyed by a short digest, each entry (expires_at, decoded).
+# Repeat requests on the same short-lived token skip the RSA verification.
+# This runs concurrently from anyio's thread pool, so every mutation (and
+# the eviction scan in particular) happens under the lock.
+_token_cache: dict = {}
+_token_cache_lock = threading.Lock()
+_TOKEN_CACHE_MAX = 10000
+_TOKEN_EXP_SKEW = 30
+
 
 def verify_firebase_token(id_token: str) -> dict:
     """Verify Firebase ID token and return decoded token"""
+    key = hashlib.blake2b(id_token.encode(), digest_size=16).digest()
+    entry = _token_cache.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    from firebase_admin import auth
+
     try:
         decoded_token = auth.verify_id_token(id_token)
-        return decoded_token
     except Exception as e:
-        raise ValueError(f"Invalid token: {str(e)}")
\ No newline at end of file
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        raise ValueError(f"Invalid token: {str(e)}")
+
+    exp = decoded_token.get("exp")
+    if exp:
+        with _token_cache_lock:
+            if len(_token_cache) >= _TOKEN_CACHE_MAX:
+                now = time.time()
+                for k in [k for k, v in _token_cache.items() if v[0] <= now]:
+                    del _token_cache[k]
+                # Nothing expired: dicts iterate in insertion order, so
+                # dropping from the front evicts the oldest entries and the
+                # cache stays at its cap.
+                while len(_token_cache) >= _TOKEN_CACHE_MAX:
+                    del _token_cache[next(iter(_token_cache))]
+            _token_cache[key] = (exp - _TOKEN_EXP_SKEW, decoded_token)
+    return decoded_token
+
+
+class FirebaseClient:
+    """Convenience wrapper around Firebase Auth lookups and Firestore documents"""
+
+    _USER_CACHE_MAX = 4096
+    _USER_CACHE_TTL = 60
+
+    def __init__(self):
+        self.db = None
+        # uid -> (expires_at, user dict); repeat lookups of the same uid
+        # within the TTL skip the synchronous REST call to Firebase Auth.
+        self._user_cache: dict = {}
+        self._user_cache_lock = threading.Lock()
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(os.getenv("FIRESTORE_POOL", "20"))
+        )
+        self.async_db = None
+        try:
+            initialize_firebase_admin()
+            from firebase_admin import firestore
+
+            # The one firestore.client() for this process; every collection
+            # shares its gRPC channel pool.
+            self.db = firestore.client()
+            try:
+                from firebase_admin import firestore_async
+
+                self.async_db = firestore_async.client()
+            except ImportError:
+                print("firestore_async not available, async Firestore methods disabled")
+        except Exception as e:
+            print(f"Firestore client not available: {e}")
+
+    def get_user(self, uid: str) -> dict:
+        """Return user info for `uid`, cached for a short TTL"""
+        entry = self._user_cache.get(uid)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+
+        user = self._get_user_uncached(uid)
+
+        now = time.time()
+        with self._user_cache_lock:
+            if len(self._user_cache) >= self._USER_CACHE_MAX:
+                for k in [k for k, v in self._user_cache.items() if v[0] <= now]:
+                    del self._user_cache[k]
+            self._user_cache[uid] = (now + self._USER_CACHE_TTL, user)
+        return user
+
+    def _get_user_uncached(self, uid: str) -> dict:
+        from firebase_admin import auth
+
+        record = auth.get_user(uid)
+        return {
+            "uid": record.uid,
+            "email": record.email,
+            "display_name": record.display_name,
+            "photo_url": record.photo_url,
+            "disabled": record.disabled,
+            "providers": [p.provider_id for p in record.provider_data],
+        }
+
+    def invalidate_user(self, uid: str) -> None:
+        """Drop `uid` from the user cache (e.g. after a token failure)"""
+        self._user_cache.pop(uid, None)
+
+    def get_document(self, collection: str, doc_id: str) -> dict | None:
+        doc = self.db.collection(collection).document(doc_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    def set_document(self, collection: str, doc_id: str, data: dict, merge: bool = True) -> None:
+        self.db.collection(collection).document(doc_id).set(data, merge=merge)
+
+    def update_document(self, collection: str, doc_id: str, data: dict) -> None:
+        self.db.collection(collection).document(doc_id).update(data)
+
+    def delete_document(self, collection: str, doc_id: str) -> None:
+        self.db.collection(collection).document(doc_id).delete()
+
+    # Async variants for FastAPI handlers: Firestore I/O awaits on the event
+    # loop instead of blocking it for the RTT. Sync methods stay for scripts.
+
+    async def aget_document(self, collection: str, doc_id: str) -> dict | None:
+        doc = await self.async_db.collection(collection).document(doc_id).get()
+        return doc.to_dict() if doc.exists else None
+
+    async def aset_document(self, collection: str, doc_id: str, data: dict, merge: bool = True) -> None:
+        await self.async_db.collection(collection).document(doc_id).set(data, merge=merge)
+
+    async def aupdate_document(self, collection: str, doc_id: str, data: dict) -> None:
+        await self.async_db.collection(collection).document(doc_id).update(data)
+
+    async def adelete_document(self, collection: str, doc_id: str) -> None:
+        await self.async_db.collection(collection).document(doc_id).delete()
+
+    # Firestore commits at most 500 operations per WriteBatch
+    BATCH_LIMIT = 500
+    _COMMIT_RETRIES = 5
+
+    def _commit_with_retry(self, batch) -> None:
+        """Commit one batch, backing off on transient Firestore errors"""
+        retryable = _retryable_errors()
+        for attempt in range(self._COMMIT_RETRIES):
+            try:
+                batch.commit()
+                return
+            except retryable:
+                if attempt == self._COMMIT_RETRIES - 1:
+                    raise
+                time.sleep(0.1 * (2 ** attempt))
+
+    def _commit_batches(self, batches: list) -> None:
+        """Dispatch batch commits across the thread pool and wait for all"""
+        if len(batches) == 1:
+            self._commit_with_retry(batches[0])
+            return
+        futures = [self._pool.submit(self._commit_with_retry, b) for b in batches]
+        concurrent.futures.wait(futures)
+        for f in futures:
+            f.result()
+
+    def set_documents(
+        self,
+        collection: str,
+        items: list[tuple[str, dict]],
+        merge: bool = True,
+        batch_size: int = BATCH_LIMIT,
+    ) -> None:
+        """Write many (doc_id, data) pairs in concurrent WriteBatch commits"""
+        col = self.db.collection(collection)
+        batches = []
+        for start in range(0, len(items), batch_size):
+            batch = self.db.batch()
+            for doc_id, data in items[start:start + batch_size]:
+                batch.set(col.document(doc_id), data, merge=merge)
+            batches.append(batch)
+        self._commit_batches(batches)
+
+    def update_documents(
+        self,
+        collection: str,
+        items: list[tuple[str, dict]],
+        batch_size: int = BATCH_LIMIT,
+    ) -> None:
+        """Update many (doc_id, data) pairs in concurrent WriteBatch commits"""
+        col = self.db.collection(collection)
+        batches = []
+        for start in range(0, len(items), batch_size):
+            batch = self.db.batch()
+            for doc_id, data in items[start:start + batch_size]:
+                batch.update(col.document(doc_id), data)
+            batches.append(batch)
+        self._commit_batches(batches)
+
+    def delete_documents(
+        self,
+        collection: str,
+        doc_ids: list[str],
+        batch_size: int = BATCH_LIMIT,
+    ) -> None:
+        """Delete many documents in concurrent WriteBatch commits"""
+        col = self.db.collection(collection)
+        batches = []
+        for start in range(0, len(doc_ids), batch_size):
+            batch = self.db.batch()
+            for doc_id in doc_ids[start:start + batch_size]:
+                batch.delete(col.document(doc_id))
+            batches.append(batch)
+        self._commit_batches(batches)
+
+    def _build_query(self, collection: str, filters: list | None, limit: int | None):
+        query = self.db.collection(collection)
+        for field, op, value in filters or []:
+            query = query.where(field, op, value)
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    def iter_collection(self, collection: str, filters: list | None = None, limit: int | None = None):
+        """Yield matching documents as dicts while gRPC fills the stream.
+
+        Callers see the first row before the whole result set is fetched and
+        never hold more than one page in memory.
+        """
+        query = self._build_query(collection, filters, limit)
+        yield from (doc.to_dict() for doc in query.stream())
+
+    def query_collection_list(self, collection: str, filters: list | None = None, limit: int | None = None) -> list:
+        """Return documents in `collection` matching `filters` as a list of dicts"""
+        return list(self.iter_collection(collection, filters, limit))
+
+    async def aiter_collection(self, collection: str, filters: list | None = None, limit: int | None = None):
+        """Async variant of iter_collection using the AsyncClient stream"""
+        query = self.async_db.collection(collection)
+        for field, op, value in filters or []:
+            query = query.where(field, op, value)
+        if limit:
+            query = query.limit(limit)
+        async for doc in query.stream():
+            yield doc.to_dict()
+
+
+@lru_cache(maxsize=None)
+def get_firebase_client() -> FirebaseClient:
+    """Return the process-wide FirebaseClient, constructed on first use.
+
+    One client (and therefore one Firestore gRPC channel pool) per uvicorn
+    worker; never call firestore.client() anywhere else.
+    """
+    return FirebaseClient()
\ No newline at end of file
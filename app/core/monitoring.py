@@ -0,0 +1,220 @@
+"""Request metrics collection with optional Prometheus export.
+
+Usage:
+
+    from app.core.monitoring import metrics, MetricsMiddleware
+
+    metrics.initialize()
+    app.add_middleware(MetricsMiddleware)
+"""
+
+import collections
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+try:
+    from prometheus_client import Counter, Histogram, Info
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    print("prometheus_client not available, using in-memory metrics")
+    PROMETHEUS_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class Metrics:
+    """Process-wide request/system metrics, Prometheus-backed when available."""
+
+    _LABEL_CACHE_MAX = 4096
+
+    def __init__(self):
+        self.metrics: Dict[str, Any] = {}
+        self._initialized = False
+        # Prometheus' labels() takes a lock and hashes the label values on
+        # every call; cache the per-label children keyed by their tuple.
+        self._counter_cache: "collections.OrderedDict[tuple, Any]" = collections.OrderedDict()
+        self._histogram_cache: "collections.OrderedDict[tuple, Any]" = collections.OrderedDict()
+        self._static_info: Dict[str, str] = {}
+        self._proc = None
+
+    def initialize(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+
+        if PROMETHEUS_AVAILABLE:
+            self.metrics["http_requests_total"] = Counter(
+                "http_requests_total",
+                "Total HTTP requests",
+                ["method", "endpoint", "status"],
+            )
+            self.metrics["http_request_duration_seconds"] = Histogram(
+                "http_request_duration_seconds",
+                "HTTP request duration in seconds",
+                ["method", "endpoint"],
+            )
+            self.metrics["system_info"] = Info("system", "System information")
+            if PSUTIL_AVAILABLE:
+                # platform()/cpu_count()/gethostname() cost ~1 ms of uname
+                # and /proc reads; they never change, so sample them once.
+                import platform
+                import socket
+
+                self._static_info = {
+                    "platform": platform.platform(),
+                    "python_version": platform.python_version(),
+                    "hostname": socket.gethostname(),
+                    "cpu_count": str(psutil.cpu_count()),
+                }
+                self._proc = psutil.Process()
+                self._proc.cpu_percent(interval=None)  # prime the sampler
+            self.update_system_metrics()
+            return
+
+        # In-memory fallback: counts per (method, endpoint, status) and a
+        # fixed-size ring buffer of recent request durations. deque(maxlen)
+        # evicts the oldest entry in O(1); no slicing copies on the hot path.
+        self.metrics["requests"] = collections.Counter()
+        self.metrics["performance"] = {
+            "request_durations": collections.deque(maxlen=1000),
+        }
+
+    def update_system_metrics(self) -> None:
+        if not (PROMETHEUS_AVAILABLE and PSUTIL_AVAILABLE):
+            return
+        # Only the genuinely dynamic readings are refreshed per scrape; the
+        # cached Process handle avoids psutil's global process-table scan.
+        self.metrics["system_info"].info(
+            {
+                **self._static_info,
+                "cpu_percent": str(self._proc.cpu_percent(interval=None)),
+                "memory_used": str(psutil.virtual_memory().used),
+            }
+        )
+
+    def track_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        duration: float,
+        start_time: float = 0.0,
+    ) -> None:
+        """Record one completed request.
+
+        `start_time` is the perf_counter float the middleware already
+        holds; it is mapped back to wall-clock time only when metrics are
+        read.
+        """
+        if not self._initialized:
+            return
+
+        if PROMETHEUS_AVAILABLE:
+            key = (method, endpoint, status)
+            counter = self._counter_cache.get(key)
+            if counter is None:
+                counter = self.metrics["http_requests_total"].labels(
+                    method=method, endpoint=endpoint, status=status
+                )
+                self._counter_cache[key] = counter
+                if len(self._counter_cache) > self._LABEL_CACHE_MAX:
+                    self._counter_cache.popitem(last=False)
+            counter.inc()
+
+            hkey = (method, endpoint)
+            histogram = self._histogram_cache.get(hkey)
+            if histogram is None:
+                histogram = self.metrics["http_request_duration_seconds"].labels(
+                    method=method, endpoint=endpoint
+                )
+                self._histogram_cache[hkey] = histogram
+                if len(self._histogram_cache) > self._LABEL_CACHE_MAX:
+                    self._histogram_cache.popitem(last=False)
+            histogram.observe(duration)
+            return
+
+        self.metrics["requests"][(method, endpoint, status)] += 1
+        self.metrics["performance"]["request_durations"].append(
+            {
+                "endpoint": endpoint,
+                "method": method,
+                "duration": duration,
+                "t": start_time,
+            }
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the in-memory metrics (Prometheus scrapes /metrics itself)."""
+        if PROMETHEUS_AVAILABLE or not self._initialized:
+            return {}
+        # Maps stored perf_counter values back onto the epoch timeline.
+        offset = time.time() - time.perf_counter()
+        return {
+            "requests": {
+                f"{m} {e} {s}": c
+                for (m, e, s), c in self.metrics["requests"].items()
+            },
+            "recent_durations": [
+                {**d, "timestamp": datetime.fromtimestamp(offset + d["t"]).isoformat()}
+                for d in self.metrics["performance"]["request_durations"]
+            ],
+        }
+
+
+# Shared metrics instance used by the middleware and /metrics endpoint
+metrics = Metrics()
+
+# Infrastructure probes that would only add noise (and overhead) to the
+# request metrics; frozenset membership is one hash probe.
+_SKIP_PATHS = frozenset({"/metrics", "/healthz", "/health", "/ready", "/favicon.ico"})
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Track method/endpoint/status/duration for every request."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in _SKIP_PATHS:
+            return await call_next(request)
+
+        # perf_counter is monotonic (no NTP step ever yields a negative
+        # duration polluting the histograms) and cheaper than time.time.
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception:
+            # The exception re-raises to the error handlers; tracking only
+            # needs the status code, so don't build a throwaway Response.
+            duration = time.perf_counter() - start_time
+            metrics.track_request(
+                request.method,
+                self._endpoint_label(request),
+                500,
+                duration,
+                start_time,
+            )
+            raise
+        duration = time.perf_counter() - start_time
+        metrics.track_request(
+            request.method,
+            self._endpoint_label(request),
+            response.status_code,
+            duration,
+            start_time,
+        )
+        return response
+
+    @staticmethod
+    def _endpoint_label(request: Request) -> str:
+        # The templated route path ("/users/{uid}") keeps label cardinality
+        # bounded by the number of registered routes; the raw URL path would
+        # mint a new label set per path-parameter value.
+        route = request.scope.get("route")
+        return route.path if route is not None else request.url.path
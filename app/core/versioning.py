@@ -0,0 +1,49 @@
+"""API version negotiation helpers.
+
+Usage:
+
+    from app.core.versioning import APIVersion, get_version_from_request
+
+    version = get_version_from_request(request.url.path)
+"""
+
+import functools
+from enum import Enum
+from typing import Optional
+
+
+class APIVersion(str, Enum):
+    V1 = "v1"
+    V2 = "v2"
+
+    @classmethod
+    def from_string(cls, version: str) -> Optional["APIVersion"]:
+        """Parse 'v1'/'V1' style strings; returns None for unknown versions"""
+        return _from_string_cached(version)
+
+
+@functools.lru_cache(maxsize=16)
+def _from_string_cached(version: str) -> Optional[APIVersion]:
+    # The set of incoming version strings is tiny; memoizing skips the
+    # .lower() and the ValueError raised/caught for every garbage version.
+    try:
+        return APIVersion(version.lower())
+    except ValueError:
+        return None
+
+
+DEFAULT_VERSION = APIVersion.V1
+
+
+def get_version_from_request(path: str) -> APIVersion:
+    """Extract the API version from a request path, defaulting to v1.
+
+    Versioned paths always look like /api/vN/..., so a bounded str.split
+    is enough — no regex engine on the per-request path.
+    """
+    parts = path.split("/", 3)
+    if len(parts) >= 3 and parts[1] == "api":
+        version = APIVersion.from_string(parts[2])
+        if version is not None:
+            return version
+    return DEFAULT_VERSION
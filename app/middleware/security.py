@@ -0,0 +1,225 @@
+"""Rate limiting and security header middleware.
+
+Both middlewares are raw ASGI callables rather than BaseHTTPMiddleware
+subclasses: no per-request anyio task group, memory stream, or
+Request/Response wrapping on the hot path.
+
+Usage:
+
+    from app.middleware.security import RateLimitMiddleware, SecurityHeadersMiddleware
+
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RateLimitMiddleware, rate_limit=100, window_size=60)
+"""
+
+import math
+import re
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+DEFAULT_EXCLUDE_PATHS = ["/docs", "/redoc", "/openapi.json", "/metrics", "/health"]
+
+_RATE_LIMIT_BODY = b'{"detail":"Rate limit exceeded"}'
+
+# Atomic token bucket: HGETs (tokens, last), applies the refill math and
+# writes back in one round trip, so concurrent workers can't race a shared
+# bucket. Returns {allowed, tokens}.
+TOKEN_BUCKET_LUA = """
+local rate = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local data = redis.call('HMGET', KEYS[1], 'tokens', 'last')
+local tokens = tonumber(data[1])
+local last = tonumber(data[2])
+if tokens == nil then
+    tokens = rate
+    last = now
+end
+tokens = math.min(rate, tokens + (now - last) * rate / window)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last', now)
+redis.call('EXPIRE', KEYS[1], window * 10)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RateLimitMiddleware:
+    """Per-IP token bucket limiter: `rate_limit` requests per `window_size` seconds.
+
+    Each IP carries just two floats, (tokens, last_refill). A request refills
+    tokens proportionally to the elapsed time and spends one — an O(1),
+    allocation-free check, unlike sliding-window timestamp lists that are
+    rebuilt per request.
+    """
+
+    # Sweep idle buckets every this many requests
+    _SWEEP_INTERVAL = 4096
+    _NUM_SHARDS = 16
+
+    def __init__(
+        self,
+        app,
+        rate_limit: int = 100,
+        window_size: int = 60,
+        exclude_paths: Optional[List[str]] = None,
+        max_tracked: int = 100_000,
+        backend: str = "memory",
+        redis_url: Optional[str] = None,
+    ):
+        self.app = app
+        self.rate_limit = rate_limit
+        self.window_size = window_size
+        self.exclude_paths = (
+            exclude_paths if exclude_paths is not None else DEFAULT_EXCLUDE_PATHS
+        )
+        # One anchored alternation beats a Python-level startswith loop: the
+        # whole prefix match runs inside _sre in C.
+        self._exclude_re = (
+            re.compile("^(" + "|".join(re.escape(p) for p in self.exclude_paths) + ")")
+            if self.exclude_paths
+            else None
+        )
+        # State is sharded by hash(ip) so a hot dict resize stalls at most
+        # 1/16th of clients. Each shard is LRU-ordered so scanner/botnet
+        # traffic can't grow worker memory without bound: least-recently-seen
+        # IPs are evicted past its share of max_tracked.
+        self.shards: List["OrderedDict[str, Tuple[float, float]]"] = [
+            OrderedDict() for _ in range(self._NUM_SHARDS)
+        ]
+        self.max_tracked = max_tracked
+        self._max_per_shard = max(1, max_tracked // self._NUM_SHARDS)
+        self._requests_since_sweep = 0
+
+        # backend="redis" shares one bucket per IP across workers via the
+        # atomic Lua script; in-memory is the default (and the fallback when
+        # Redis is unreachable, failing open per worker).
+        self.backend = backend
+        self._redis = None
+        self._bucket_script = None
+        if backend == "redis":
+            try:
+                import redis.asyncio
+
+                self._redis = redis.asyncio.Redis.from_url(
+                    redis_url or "redis://localhost:6379"
+                )
+                self._bucket_script = self._redis.register_script(TOKEN_BUCKET_LUA)
+            except Exception as e:
+                print(f"Rate-limit Redis backend unavailable, using memory: {e}")
+                self._redis = None
+
+    def _sweep_idle(self, now: float) -> None:
+        """Drop buckets idle long enough to be fully refilled — they carry no state."""
+        cutoff = now - 10 * self.window_size
+        for shard in self.shards:
+            stale = [ip for ip, (_, last) in shard.items() if last < cutoff]
+            for ip in stale:
+                del shard[ip]
+
+    def _check_memory(self, client_ip: str, now: float) -> Tuple[bool, float]:
+        """Refill-and-spend on the local shard; returns (allowed, tokens)."""
+        shard = self.shards[hash(client_ip) & (self._NUM_SHARDS - 1)]
+        entry = shard.get(client_ip)
+        if entry is not None:
+            shard.move_to_end(client_ip)
+            tokens, last = entry
+        else:
+            tokens, last = float(self.rate_limit), now
+        tokens = min(
+            float(self.rate_limit),
+            tokens + (now - last) * self.rate_limit / self.window_size,
+        )
+        if tokens < 1.0:
+            return False, tokens
+        shard[client_ip] = (tokens - 1.0, now)
+        while len(shard) > self._max_per_shard:
+            shard.popitem(last=False)
+        return True, tokens
+
+    async def _check_redis(self, client_ip: str) -> Tuple[bool, float]:
+        """Run the shared token bucket in Redis; one round trip per request."""
+        allowed, tokens = await self._bucket_script(
+            keys=[f"ratelimit:{client_ip}"],
+            args=[self.rate_limit, self.window_size, time.time()],
+        )
+        return bool(allowed), float(tokens)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if self._exclude_re is not None and self._exclude_re.match(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        now = time.monotonic()
+
+        self._requests_since_sweep += 1
+        if self._requests_since_sweep >= self._SWEEP_INTERVAL:
+            self._requests_since_sweep = 0
+            self._sweep_idle(now)
+
+        if self._redis is not None:
+            try:
+                allowed, tokens = await self._check_redis(client_ip)
+            except Exception:
+                allowed, tokens = self._check_memory(client_ip, now)
+        else:
+            allowed, tokens = self._check_memory(client_ip, now)
+
+        if not allowed:
+            retry_after = math.ceil((1.0 - tokens) * self.window_size / self.rate_limit)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(_RATE_LIMIT_BODY)).encode()),
+                        (b"retry-after", str(retry_after).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": _RATE_LIMIT_BODY})
+            return
+
+        await self.app(scope, receive, send)
+
+
+class SecurityHeadersMiddleware:
+    """Attach standard security headers to every response."""
+
+    # ASGI headers are (bytes, bytes) pairs; encoding these once at class
+    # definition removes ten .encode() calls per request.
+    SECURITY_HEADERS: List[Tuple[bytes, bytes]] = [
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = (
+                    list(message.get("headers") or []) + self.SECURITY_HEADERS
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
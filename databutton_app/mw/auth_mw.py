@@ -1,4 +1,9 @@
 import functools
+import hashlib
+import threading
+import time
+
+import anyio.to_thread
 from http import HTTPStatus
 from typing import Annotated, Callable, Dict, Any, Optional
 
@@ -53,9 +58,14 @@ def get_audit_log(request: HTTPConnection) -> Callable[[str], None] | None:
 AuditLogDep = Annotated[Callable[[str], None] | None, Depends(get_audit_log)]
 
 
-def get_authorized_user(
+async def get_authorized_user(
     request: HTTPConnection,
 ) -> User:
+    # async so FastAPI resolves this dependency inline on the event loop;
+    # sync dependencies are shipped to anyio's default 40-thread pool, which
+    # saturates (and queues requests) under concurrent authenticated load.
+    # The common case (payload-cache hit) stays on the loop; only a miss —
+    # which may block on a JWKS refresh — is sent to a worker thread.
     # If JWT is not available, return a default user
     if not JWT_AVAILABLE:
         return User(sub="default_user", name="Default User", email="default@example.com")
@@ -67,12 +77,23 @@ def get_authorized_user(
 
     try:
         if isinstance(request, WebSocket):
-            user = authorize_websocket(request, auth_config)
+            token = _websocket_token(request)
         elif isinstance(request, Request):
-            user = authorize_request(request, auth_config)
+            token = _request_token(request, auth_config)
         else:
             raise ValueError("Unexpected request type")
 
+        user = None
+        if token:
+            user = _cached_user(token)
+            if user is None:
+                # Cache miss: verification may hit the network (PyJWKClient
+                # refetches the JWKS on cold start and hourly thereafter,
+                # a blocking urllib call) — keep it off the event loop.
+                user = await anyio.to_thread.run_sync(
+                    authorize_token, token, auth_config
+                )
+
         if user is not None:
             return user
         print("Request authentication returned no user")
@@ -89,12 +110,12 @@ def get_authorized_user(
         )
 
 
-@functools.cache
+@functools.lru_cache(maxsize=8)
 def get_jwks_client(url: str):
     """Reuse client cached by its url, client caches keys by default."""
     if not JWT_AVAILABLE:
         return None
-    return PyJWKClient(url, cache_keys=True)
+    return PyJWKClient(url, cache_keys=True, lifespan=3600)
 
 
 def get_signing_key(url: str, token: str) -> tuple[str, str]:
@@ -111,10 +132,7 @@ def get_signing_key(url: str, token: str) -> tuple[str, str]:
     return (key, alg)
 
 
-def authorize_websocket(
-    request: WebSocket,
-    auth_config: AuthConfig,
-) -> User | None:
+def _websocket_token(request: WebSocket) -> str | None:
     # Parse Sec-Websocket-Protocol
     header = "Sec-Websocket-Protocol"
     sep = ","
@@ -124,23 +142,15 @@ def authorize_websocket(
         [h.strip() for h in protocols_header.split(sep)] if protocols_header else []
     )
 
-    token: str | None = None
     for p in protocols:
         if p.startswith(prefix):
-            token = p.removeprefix(prefix)
-            break
+            return p.removeprefix(prefix)
 
-    if not token:
-        print(f"Missing bearer {prefix}.<token> in protocols")
-        return None
-
-    return authorize_token(token, auth_config)
+    print(f"Missing bearer {prefix}.<token> in protocols")
+    return None
 
 
-def authorize_request(
-    request: Request,
-    auth_config: AuthConfig,
-) -> User | None:
+def _request_token(request: Request, auth_config: AuthConfig) -> str | None:
     auth_header = request.headers.get(auth_config.header)
     if not auth_header:
         print(f"Missing header '{auth_config.header}'")
@@ -151,9 +161,51 @@ def authorize_request(
         print(f"Missing bearer token in '{auth_config.header}'")
         return None
 
+    return token
+
+
+def authorize_websocket(
+    request: WebSocket,
+    auth_config: AuthConfig,
+) -> User | None:
+    token = _websocket_token(request)
+    if not token:
+        return None
+    return authorize_token(token, auth_config)
+
+
+def authorize_request(
+    request: Request,
+    auth_config: AuthConfig,
+) -> User | None:
+    token = _request_token(request, auth_config)
+    if not token:
+        return None
     return authorize_token(token, auth_config)
 
 
+# Verified token payloads keyed by a short token digest. RS256 signature
+# verification costs 1-5 ms of CPU per request; the same short-lived token
+# arrives dozens of times, so cache its payload until min(exp, now + TTL).
+_payload_cache: Dict[bytes, tuple] = {}
+_payload_cache_lock = threading.Lock()
+_PAYLOAD_CACHE_MAX = 10000
+_PAYLOAD_CACHE_TTL = 60
+
+
+def _cached_user(token: str) -> User | None:
+    """Return the User for a still-valid cached payload, else None."""
+    entry = _payload_cache.get(
+        hashlib.blake2b(token.encode(), digest_size=16).digest()
+    )
+    if entry is not None and entry[0] > time.time():
+        try:
+            return User.model_validate(entry[1])
+        except Exception as e:
+            print(f"Failed to parse token payload {e}")
+    return None
+
+
 def authorize_token(
     token: str,
     auth_config: AuthConfig,
@@ -162,6 +214,11 @@ def authorize_token(
         # Return a mock user if JWT is not available
         return User(sub="default_user", name="Default User", email="default@example.com")
 
+    cached = _cached_user(token)
+    if cached is not None:
+        return cached
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
     # Audience and jwks url to get signing key from based on the users config
     jwks_urls = [(auth_config.audience, auth_config.jwks_url)]
 
@@ -184,6 +241,20 @@ def authorize_token(
             print(f"Failed to decode and validate token {e}")
             continue
 
+    if payload is not None:
+        now = time.time()
+        expires_at = min(payload.get("exp", now + _PAYLOAD_CACHE_TTL), now + _PAYLOAD_CACHE_TTL)
+        with _payload_cache_lock:
+            if len(_payload_cache) >= _PAYLOAD_CACHE_MAX:
+                for k in [k for k, v in _payload_cache.items() if v[0] <= now]:
+                    del _payload_cache[k]
+                # Nothing expired: dicts iterate in insertion order, so
+                # dropping from the front evicts the oldest entries and the
+                # cache stays at its cap.
+                while len(_payload_cache) >= _PAYLOAD_CACHE_MAX:
+                    del _payload_cache[next(iter(_payload_cache))]
+            _payload_cache[cache_key] = (expires_at, payload)
+
     try:
         user = User.model_validate(payload)
         print(f"User {user.sub} authenticated")
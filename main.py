@@ -1,8 +1,13 @@
+import asyncio
+import functools
+import importlib
 import os
 import pathlib
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from fastapi import FastAPI, APIRouter, Depends
+from fastapi import FastAPI, APIRouter, Depends, Response
 from typing import TypeVar
 
 # Define a custom type for BiteBase Intelligence APIs
@@ -13,6 +18,7 @@ load_dotenv()
 from databutton_app.mw.auth_mw import AuthConfig, get_authorized_user
 
 
+@functools.lru_cache(maxsize=1)
 def get_router_config() -> dict:
     try:
         # Try to load the router configuration
@@ -39,28 +45,43 @@ def is_auth_disabled(router_config: dict, name: str) -> bool:
         return True
 
 
+# API modules under "app/apis/*/__init__.py", discovered once at import:
+# create_app runs per test collection, and the glob walk is all syscalls.
+_APIS_PATH = pathlib.Path(__file__).parent / "app" / "apis"
+_API_NAMES = tuple(
+    p.relative_to(_APIS_PATH).parent.as_posix()
+    for p in _APIS_PATH.glob("*/__init__.py")
+)
+
+
 def import_api_routers() -> APIRouter:
     """Create top level router including all user defined endpoints."""
     routes = APIRouter(prefix="/routes")
 
     router_config = get_router_config()
 
-    src_path = pathlib.Path(__file__).parent
-
-    # Import API routers from "src/app/apis/*/__init__.py"
-    apis_path = src_path / "app" / "apis"
+    api_module_prefix = "app.apis."
 
-    api_names = [
-        p.relative_to(apis_path).parent.as_posix()
-        for p in apis_path.glob("*/__init__.py")
-    ]
+    # Prefetch the API modules in parallel: sys.modules insertion is
+    # serialized by the import lock, but the heavy import-time work (pydantic
+    # model building, config/env reads, client construction) overlaps across
+    # threads wherever it releases the GIL for I/O.
+    def _import(name: str):
+        try:
+            return importlib.import_module(api_module_prefix + name)
+        except Exception as e:
+            print(e)
+            return None
 
-    api_module_prefix = "app.apis."
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        modules = dict(zip(_API_NAMES, executor.map(_import, _API_NAMES)))
 
-    for name in api_names:
+    for name in _API_NAMES:
         print(f"Importing API: {name}")
         try:
-            api_module = __import__(api_module_prefix + name, fromlist=[name])
+            api_module = modules[name]
+            if api_module is None:
+                continue
             api_router = getattr(api_module, "router", None)
             if isinstance(api_router, APIRouter):
                 routes.include_router(
@@ -80,6 +101,7 @@ def import_api_routers() -> APIRouter:
     return routes
 
 
+@functools.lru_cache(maxsize=1)
 def get_firebase_config() -> dict | None:
     extensions = os.environ.get("DATABUTTON_EXTENSIONS", "[]")
     extensions = json.loads(extensions)
@@ -91,11 +113,213 @@ def get_firebase_config() -> dict | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _optional_import(module: str):
+    """Resolve an optional app module on first use, memoized per process.
+
+    Returns None (once, with a log line) when the module or one of its
+    dependencies is missing; repeated create_app calls don't re-pay the
+    import attempt.
+    """
+    try:
+        return importlib.import_module(module)
+    except Exception as e:
+        print(f"Optional module {module} not available: {e}")
+        return None
+
+
+# System/dependency readings served by /health. A background task refreshes
+# them every few seconds; the endpoint itself never touches psutil or probes
+# dependencies, so a load balancer polling /health can't block the loop.
+_SYS_INFO: dict = {"status": "starting"}
+_SYS_SAMPLE_INTERVAL = 5.0
+# Strong reference to the sampler task: asyncio only keeps weak references
+# to tasks, and one sampler per process is enough even if create_app runs
+# more than once.
+_SAMPLER_TASK = None
+
+
+@functools.lru_cache(maxsize=1)
+def _health_static() -> dict:
+    """The /health fields that cannot change after process start.
+
+    platform.platform() does uname() syscalls and the module probes run
+    imports; computing this per probe would be pure waste under a load
+    balancer polling every second.
+    """
+    import platform
+
+    def _importable(module: str) -> bool:
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            return False
+
+    return {
+        "environment": os.environ.get("DATABUTTON_SERVICE_TYPE", "development"),
+        "system": {
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "modules": {
+            "redis": _importable("redis"),
+            "sqlalchemy": _importable("sqlalchemy"),
+            "firebase_admin": _importable("firebase_admin"),
+            "prometheus_client": _importable("prometheus_client"),
+        },
+    }
+
+
+def _sample_system() -> dict:
+    info: dict = {"status": "ok"}
+    try:
+        import psutil
+
+        info["cpu_percent"] = psutil.cpu_percent(interval=None)
+        info["memory_percent"] = psutil.virtual_memory().percent
+    except Exception:
+        pass
+    return info
+
+
+async def _probe_cache() -> str:
+    from app.core.cache import cache
+
+    if cache.async_redis_client is not None:
+        await asyncio.wait_for(cache.async_redis_client.ping(), timeout=0.5)
+        return "connected"
+    if cache.redis_client is not None:
+        await asyncio.to_thread(cache.redis_client.ping)
+        return "connected"
+    return "memory"
+
+
+async def _probe_database() -> str:
+    from app.core.database import db_client
+
+    if db_client.engine is None:
+        return "not_configured"
+    await asyncio.to_thread(db_client.execute_query, "SELECT 1")
+    return "connected"
+
+
+async def _sys_sampler() -> None:
+    global _SYS_INFO
+    while True:
+        try:
+            # Both probes run concurrently; the Redis ping goes through the
+            # async client (no event-loop-blocking socket round trip) with a
+            # hard 0.5s cap so a wedged dependency can't stall the sampler.
+            info, cache_status, db_status = await asyncio.gather(
+                asyncio.to_thread(_sample_system),
+                _probe_cache(),
+                _probe_database(),
+                return_exceptions=True,
+            )
+            if isinstance(info, BaseException):
+                info = {"status": "ok"}
+            info["cache"] = (
+                "error" if isinstance(cache_status, BaseException) else cache_status
+            )
+            info["database"] = (
+                "error" if isinstance(db_status, BaseException) else db_status
+            )
+            _SYS_INFO = info
+        except Exception as e:
+            print(f"System sampler failed: {e}")
+        await asyncio.sleep(_SYS_SAMPLE_INTERVAL)
+
+
 def create_app() -> BiteBaseIntelligenceAPIs:
     """Create the app. This is called by uvicorn with the factory option to construct the app object."""
-    app = FastAPI()
+    try:
+        # orjson serializes nested dict payloads (foot traffic, analytics)
+        # several times faster than stdlib json and emits bytes directly.
+        import orjson  # noqa: F401
+        from fastapi.responses import ORJSONResponse
+
+        app = FastAPI(default_response_class=ORJSONResponse)
+    except ImportError:
+        print("orjson not available, using default JSON responses")
+        app = FastAPI()
     app.include_router(import_api_routers())
 
+    errors = _optional_import("app.core.errors")
+    if errors is not None:
+        errors.register_error_handlers(app)
+
+    # Connect the shared cache and database clients; without this the Redis
+    # and SQLAlchemy code paths (and the /health probes) are unreachable.
+    # Both no-op gracefully when their URL or driver is absent.
+    core_cache = _optional_import("app.core.cache")
+    if core_cache is not None and core_cache.cache.redis_client is None:
+        core_cache.cache.initialize(os.getenv("REDIS_URL"))
+
+    core_db = _optional_import("app.core.database")
+    if core_db is not None and core_db.db_client.engine is None:
+        core_db.db_client.initialize()
+
+    # Middleware order matters for performance: add_middleware prepends, so
+    # the registrations below run innermost-first. The resulting stack,
+    # outermost to innermost, is
+    #   RateLimit -> RequestId -> Timing -> SecurityHeaders -> Metrics
+    # so rate-limited requests are rejected before any ID generation,
+    # timing, header or metrics work happens.
+    monitoring = _optional_import("app.core.monitoring")
+    if monitoring is not None:
+        monitoring.metrics.initialize()
+        app.add_middleware(monitoring.MetricsMiddleware)
+
+        if monitoring.PROMETHEUS_AVAILABLE:
+            from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+            @app.get("/metrics")
+            def get_metrics():
+                # Prometheus scrapes the exposition format; the JSON
+                # snapshot below only exists for the in-memory fallback.
+                monitoring.metrics.update_system_metrics()
+                return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+        else:
+
+            @app.get("/metrics")
+            def get_metrics():
+                return monitoring.metrics.get_metrics()
+
+    security = _optional_import("app.middleware.security")
+    if security is not None:
+        app.add_middleware(security.SecurityHeadersMiddleware)
+
+    timing = _optional_import("app.middleware.timing")
+    if timing is not None:
+        app.add_middleware(timing.TimingMiddleware)
+
+    app_logging = _optional_import("app.core.logging")
+    if app_logging is not None:
+        app.add_middleware(app_logging.RequestIdMiddleware)
+
+    if security is not None:
+        app.add_middleware(security.RateLimitMiddleware)
+
+    @app.on_event("startup")
+    async def start_system_sampler():
+        global _SAMPLER_TASK
+        if _SAMPLER_TASK is None or _SAMPLER_TASK.done():
+            _SAMPLER_TASK = asyncio.create_task(_sys_sampler())
+
+    @app.get("/health")
+    async def health_check():
+        static = _health_static()
+        return {
+            **static,
+            "status": "healthy",
+            "timestamp": time.time(),
+            # Static process facts and the sampler's readings share the
+            # "system" block; the sampler dict must not shadow the static one.
+            "system": {**static["system"], **_SYS_INFO},
+        }
+
     for route in app.routes:
         if hasattr(route, "methods"):
             for method in route.methods: